@@ -1,8 +1,39 @@
-from screen_recorder.gui.app import ScreenRecorderGUI
+import argparse
+from screen_recorder.utils.paths import RECORDINGS_FOLDER
 
 def main():
-    app = ScreenRecorderGUI()
+    parser = argparse.ArgumentParser(description="Screen Recorder Pro")
+    parser.add_argument(
+        "--sync",
+        nargs="?",
+        const=RECORDINGS_FOLDER,
+        metavar="FOLDER",
+        help="Upload missing or changed recordings in FOLDER to S3 and exit"
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Sample memory while recording and write a report under logs/"
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=float,
+        metavar="MB",
+        help="Spill recording buffers to disk once process memory reaches MB"
+    )
+    args = parser.parse_args()
+
+    if args.sync:
+        from screen_recorder.core.s3_uploader import S3Uploader
+        S3Uploader().sync_folder(args.sync)
+        return
+
+    from screen_recorder.gui.app import ScreenRecorderGUI
+    app = ScreenRecorderGUI(
+        profile_memory=args.profile_memory,
+        memory_limit_mb=args.memory_limit
+    )
     app.run()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
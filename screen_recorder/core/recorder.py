@@ -8,11 +8,14 @@ import soundfile as sf
 import subprocess
 from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
 from pynput import keyboard
+from ..utils.logger import Logger
+from ..utils.memory_monitor import MemoryMonitor
+from ..utils.paths import RECORDINGS_FOLDER
 
 class ScreenRecorder:
     """Core screen recording functionality"""
     
-    def __init__(self):
+    def __init__(self, profile_memory=False, memory_limit_mb=None):
         self.recording = False
         self.paused = False
         self.frames = []
@@ -23,6 +26,14 @@ class ScreenRecorder:
         self.listener = None
         self.start_time = None
         self.end_time = None
+
+        # Memory instrumentation and ceiling
+        self.profile_memory = profile_memory
+        self.memory_limit_mb = memory_limit_mb
+        self.memory_monitor = None
+        self.last_memory_report = None
+        self._audio_lock = threading.Lock()
+        self._reset_buffers()
         
         # Initialize MSS for each thread
         self._setup_directories()
@@ -30,8 +41,7 @@ class ScreenRecorder:
 
     def _setup_directories(self):
         """Setup necessary directories for recording storage"""
-        desktop_dir = os.path.join(os.path.expanduser("~"), "Desktop")
-        self.output_folder = os.path.join(desktop_dir, "ScreenRecordings")
+        self.output_folder = RECORDINGS_FOLDER
         self.temp_dir = os.path.join(self.output_folder, "temp")
         
         # Create directories if they don't exist
@@ -44,27 +54,69 @@ class ScreenRecorder:
         print("Available audio devices:")
         print(sd.query_devices())
 
+    def _reset_buffers(self):
+        """Clear recorded data and its byte accounting"""
+        self.frames = []
+        self.audio_frames = []
+        self._frames_bytes = 0
+        self._audio_bytes = 0
+        self._spill_requested = False
+        self._frame_spill = None
+        self._audio_spill = None
+        self._spilled_frames = 0
+        self._spilled_audio = False
+        self._frame_shape = None
+        self._frame_dtype = None
+
+    def _buffer_sizes(self):
+        """Bytes currently held by each recording buffer"""
+        # Read once: the recording thread may reset these concurrently
+        shape, dtype = self._frame_shape, self._frame_dtype
+        spilled = 0
+        if shape is not None and dtype is not None:
+            spilled = self._spilled_frames * int(np.prod(shape)) * dtype.itemsize
+        return {
+            'frames': self._frames_bytes,
+            'audio_frames': self._audio_bytes,
+            'frames_on_disk': spilled
+        }
+
     def start_recording(self):
         """Start screen and audio recording"""
         if self.recording:
             return
             
         self.recording = True
-        self.frames = []
-        self.audio_frames = []
+        self.last_memory_report = None
+        self._reset_buffers()
         self.start_time = time.time()
+
+        if self.profile_memory or self.memory_limit_mb:
+            self.memory_monitor = MemoryMonitor(
+                self._buffer_sizes,
+                trace=self.profile_memory,
+                limit_mb=self.memory_limit_mb,
+                on_limit=self._request_spill
+            )
+            self.memory_monitor.start()
         
         # Start screen capture thread
         self.screen_thread = threading.Thread(target=self._capture_screen)
         self.screen_thread.start()
         
         # Start audio capture
-        self.audio_stream = sd.InputStream(
-            channels=self.audio_channels,
-            samplerate=self.fs,
-            callback=self._audio_callback
-        )
-        self.audio_stream.start()
+        try:
+            self.audio_stream = sd.InputStream(
+                channels=self.audio_channels,
+                samplerate=self.fs,
+                callback=self._audio_callback
+            )
+            self.audio_stream.start()
+        except Exception:
+            # Let the capture thread exit and don't leave the monitor running
+            self.recording = False
+            self._stop_memory_monitor()
+            raise
 
     def _capture_screen(self):
         """Capture screen frames"""
@@ -78,7 +130,7 @@ class ScreenRecorder:
                     try:
                         screenshot = sct.grab(monitor)
                         frame = np.array(screenshot)
-                        self.frames.append(frame)
+                        self._store_frame(frame)
                         time.sleep(1/30)  # 30 FPS
                     except Exception as e:
                         print(f"Frame capture error: {str(e)}")
@@ -89,7 +141,99 @@ class ScreenRecorder:
     def _audio_callback(self, indata, frames, time_info, status):
         """Callback for audio capture"""
         if self.recording and not self.paused:
-            self.audio_frames.append(indata.copy())
+            chunk = indata.copy()
+            with self._audio_lock:
+                self.audio_frames.append(chunk)
+                self._audio_bytes += chunk.nbytes
+
+    def _request_spill(self, rss):
+        """Called by the memory monitor when the ceiling is reached"""
+        # Only capture can spill; once it has stopped the report notes the phase
+        if not self.recording:
+            return
+        print(f"Memory ceiling reached ({rss / (1024 * 1024):.0f} MB), spilling buffers to disk")
+        self._spill_requested = True
+
+    def _store_frame(self, frame):
+        """Keep a frame in memory, or on disk once spilling has started"""
+        if self._spill_requested and self._frame_spill is None:
+            self._start_spill(frame)
+
+        if self._frame_spill is not None:
+            frame.tofile(self._frame_spill)
+            self._spilled_frames += 1
+            self._drain_audio()
+        else:
+            self.frames.append(frame)
+            self._frames_bytes += frame.nbytes
+
+    def _start_spill(self, frame):
+        """Move buffered frames and audio to temp files"""
+        self._frame_dtype = frame.dtype
+        self._frame_shape = frame.shape
+        self._frame_spill = open(os.path.join(self.temp_dir, "temp_frames.raw"), "wb")
+        self._audio_spill = sf.SoundFile(
+            os.path.join(self.temp_dir, "temp_audio.wav"),
+            mode="w",
+            samplerate=self.fs,
+            channels=self.audio_channels
+        )
+
+        for buffered in self.frames:
+            buffered.tofile(self._frame_spill)
+        self._spilled_frames = len(self.frames)
+        self.frames = []
+        self._frames_bytes = 0
+        self._drain_audio()
+
+    def _drain_audio(self):
+        """Write buffered audio chunks to the spill file"""
+        with self._audio_lock:
+            pending, self.audio_frames = self.audio_frames, []
+            self._audio_bytes = 0
+        if pending:
+            self._spilled_audio = True
+        for chunk in pending:
+            self._audio_spill.write(chunk)
+
+    def _finish_spill(self):
+        """Close spill files and map spilled frames back as read-only views"""
+        self._drain_audio()
+        self._close_spill()
+        if not self._spilled_frames:
+            return []
+        spilled = np.memmap(
+            self._frame_spill.name,
+            dtype=self._frame_dtype,
+            mode="r",
+            shape=(self._spilled_frames,) + self._frame_shape
+        )
+        return list(spilled)
+
+    def _close_spill(self):
+        """Close spill files if they are still open"""
+        if self._audio_spill is not None and not self._audio_spill.closed:
+            self._audio_spill.close()
+        if self._frame_spill is not None and not self._frame_spill.closed:
+            self._frame_spill.close()
+
+    def _stop_memory_monitor(self, timestamp=None):
+        """Stop the memory monitor and write its report when profiling"""
+        if not self.memory_monitor:
+            return
+        # Never leave a previous recording's report path behind
+        self.last_memory_report = None
+        try:
+            self.memory_monitor.stop()
+            if self.profile_memory and timestamp:
+                self.last_memory_report = self.memory_monitor.write_report(
+                    Logger.log_path(f"memory_report_{timestamp}.txt")
+                )
+                print(f"Memory report written to {self.last_memory_report}")
+        except Exception as e:
+            print(f"Memory report error: {str(e)}")
+        finally:
+            self.memory_monitor = None
 
     def pause_recording(self):
         """Pause the recording"""
@@ -103,55 +247,83 @@ class ScreenRecorder:
         """Stop recording and save the file"""
         if not self.recording:
             return None
-            
+
+        # Set before clearing recording so a late ceiling hit is reported as encoding
+        if self.memory_monitor:
+            self.memory_monitor.phase = "encoding"
         self.recording = False
         self.end_time = time.time()
-        
-        if self.audio_stream:
-            self.audio_stream.stop()
-            self.audio_stream.close()
-        
-        # Wait for screen capture thread to finish
-        if hasattr(self, 'screen_thread'):
-            self.screen_thread.join()
-        
+
         # Generate timestamp for filename
         timestamp = time.strftime("%Y%m%d-%H%M%S")
         output_path = os.path.join(self.output_folder, f"recording_{timestamp}.mp4")
-        
-        # Create video from frames
-        if self.frames:
-            clip = ImageSequenceClip(self.frames, fps=30)
+        audio_path = os.path.join(self.temp_dir, "temp_audio.wav")
+        frames_path = os.path.join(self.temp_dir, "temp_frames.raw")
+
+        try:
+            if self.audio_stream:
+                self.audio_stream.stop()
+                self.audio_stream.close()
             
-            # Save audio if captured
-            if self.audio_frames:
-                audio_data = np.concatenate(self.audio_frames, axis=0)
-                audio_path = os.path.join(self.temp_dir, "temp_audio.wav")
-                sf.write(audio_path, audio_data, self.fs)
-                
-                # Combine video and audio
-                clip.write_videofile(
-                    output_path,
-                    codec='libx264',
-                    audio=audio_path,
-                    fps=30
-                )
-                
-                # Clean up temp audio file
-                if os.path.exists(audio_path):
-                    os.remove(audio_path)
-            else:
-                # Save video without audio
-                clip.write_videofile(
-                    output_path,
-                    codec='libx264',
-                    fps=30
-                )
-        
-        # Clear recorded data
-        self.frames = []
-        self.audio_frames = []
+            # Wait for screen capture thread to finish
+            if hasattr(self, 'screen_thread'):
+                self.screen_thread.join()
+
+            self._write_video(output_path, audio_path)
+        finally:
+            self._close_spill()
+            # Stop the monitor before resetting so its last sample still sees the buffers
+            self._stop_memory_monitor(timestamp)
+            self._reset_buffers()
+
+            # Clean up temp files
+            for temp_path in [audio_path, frames_path]:
+                if os.path.exists(temp_path):
+                    try:
+                        os.remove(temp_path)
+                    except OSError as e:
+                        print(f"Could not remove {temp_path}: {str(e)}")
         
         return output_path
 
+    def _write_video(self, output_path, audio_path):
+        """Encode captured frames and audio into output_path"""
+        spilled = self._frame_spill is not None
+        frames = self._finish_spill() if spilled else self.frames
+        clip = None
+
+        try:
+            # Create video from frames
+            if frames:
+                clip = ImageSequenceClip(frames, fps=30)
+                
+                # Save audio if captured (already on disk when spilled)
+                has_audio = self._spilled_audio if spilled else bool(self.audio_frames)
+                if has_audio:
+                    if not spilled:
+                        audio_data = np.concatenate(self.audio_frames, axis=0)
+                        sf.write(audio_path, audio_data, self.fs)
+                    
+                    # Combine video and audio
+                    clip.write_videofile(
+                        output_path,
+                        codec='libx264',
+                        audio=audio_path,
+                        fps=30
+                    )
+                else:
+                    # Save video without audio
+                    clip.write_videofile(
+                        output_path,
+                        codec='libx264',
+                        fps=30
+                    )
+        finally:
+            if clip is not None:
+                clip.close()
+            # Drop frame references so spilled memmaps are released before cleanup,
+            # even when a traceback keeps this frame alive
+            clip = None
+            frames = None
+
     # ... (rest of the ScreenRecorder methods) 
\ No newline at end of file
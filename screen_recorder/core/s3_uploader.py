@@ -1,20 +1,39 @@
 import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
+from ..utils.paths import RECORDINGS_FOLDER
 
 class S3Uploader:
     """Handles S3 upload functionality"""
-    
-    def __init__(self):
+
+    KEY_PREFIX = "lasheen-team/recording/"
+    INDEX_FILENAME = ".s3_sync_index.json"
+    RECORDING_EXTENSIONS = (".mp4",)
+    # Files modified more recently than this may still be being written
+    SETTLE_SECONDS = 10
+
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
         self.s3_config = Config(
             region_name='us-east-2',
             signature_version='s3v4',
-            retries={'max_attempts': 3}
+            retries={'max_attempts': 3},
+            # Never below botocore's default of 10, which the single-file
+            # upload_fileobj path relies on for its transfer threads
+            max_pool_connections=max(max_workers, 10)
         )
         
         self.s3_client = self._create_s3_client()
         self.bucket_name = "ghaymah-course-bucket"
 
+        # Each sync worker uploads its file serially so the shared
+        # executor stays the only source of concurrency
+        self.sync_transfer_config = TransferConfig(use_threads=False)
+
     def _create_s3_client(self):
         """Create and configure S3 client"""
         return boto3.client(
@@ -30,7 +49,7 @@ class S3Uploader:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         try:
-            s3_key = f"lasheen-team/recording/{os.path.basename(file_path)}"
+            s3_key = self._s3_key(os.path.basename(file_path))
             self._upload_with_progress(file_path, s3_key)
             return self._generate_presigned_url(s3_key)
         except Exception as e:
@@ -59,4 +78,152 @@ class S3Uploader:
                 'Key': s3_key
             },
             ExpiresIn=120
-        ) 
\ No newline at end of file
+        )
+
+    def _s3_key(self, filename):
+        """Build the S3 key for a recording filename"""
+        return f"{self.KEY_PREFIX}{filename}"
+
+    def sync_folder(self, folder_path=RECORDINGS_FOLDER):
+        """Upload recordings in folder that are missing or changed in S3
+
+        Returns a summary dict with the uploaded, skipped and failed
+        filenames plus aggregate bytes, elapsed seconds and throughput.
+        """
+        if not os.path.isdir(folder_path):
+            raise FileNotFoundError(f"Folder not found: {folder_path}")
+
+        index_path = os.path.join(folder_path, self.INDEX_FILENAME)
+        index = self._load_sync_index(index_path)
+        remote = self._list_remote_objects()
+
+        pending = []
+        skipped = []
+        for filename, stat in self._scan_local_recordings(folder_path).items():
+            if self._needs_upload(stat, index.get(filename), remote.get(filename)):
+                pending.append((filename, stat))
+            else:
+                index[filename] = stat
+                skipped.append(filename)
+
+        uploaded = []
+        failed = {}
+        total_bytes = 0
+        start = time.monotonic()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self._sync_upload,
+                        os.path.join(folder_path, filename),
+                        filename
+                    ): (filename, stat)
+                    for filename, stat in pending
+                }
+                try:
+                    for future in as_completed(futures):
+                        filename, stat = futures[future]
+                        try:
+                            future.result()
+                        except Exception as e:
+                            failed[filename] = str(e)
+                            print(f"Sync failed for {filename}: {str(e)}")
+                            continue
+                        index[filename] = stat
+                        uploaded.append(filename)
+                        total_bytes += stat['size']
+                        print(f"Synced {filename} ({len(uploaded)}/{len(pending)})")
+                except BaseException:
+                    # Drop queued uploads so the executor only waits for in-flight ones
+                    # (equivalent to shutdown(cancel_futures=True), which needs 3.9+)
+                    print("Sync interrupted, cancelling queued uploads")
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            # Keep the index for whatever finished, even when interrupted
+            self._save_sync_index(index_path, index)
+
+        elapsed = time.monotonic() - start
+
+        throughput = total_bytes / elapsed if elapsed > 0 else 0.0
+        print(
+            f"Sync complete: {len(uploaded)} uploaded, {len(skipped)} skipped, "
+            f"{len(failed)} failed, {total_bytes / 1e6:.1f} MB in {elapsed:.1f}s "
+            f"({throughput / 1e6:.2f} MB/s)"
+        )
+        return {
+            'uploaded': sorted(uploaded),
+            'skipped': sorted(skipped),
+            'failed': failed,
+            'bytes': total_bytes,
+            'seconds': elapsed,
+            'bytes_per_second': throughput
+        }
+
+    def _scan_local_recordings(self, folder_path):
+        """Return size and mtime for each settled recording in folder"""
+        recordings = {}
+        cutoff = time.time() - self.SETTLE_SECONDS
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if not entry.name.lower().endswith(self.RECORDING_EXTENSIONS):
+                    continue
+                stat = entry.stat()
+                if stat.st_mtime > cutoff:
+                    print(f"Skipping {entry.name}: still being written")
+                    continue
+                recordings[entry.name] = {
+                    'size': stat.st_size,
+                    'mtime': stat.st_mtime
+                }
+        return recordings
+
+    def _list_remote_objects(self):
+        """Return size of each object under the recording prefix"""
+        remote = {}
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self.KEY_PREFIX):
+            for obj in page.get('Contents', []):
+                filename = obj['Key'][len(self.KEY_PREFIX):]
+                if filename and '/' not in filename:
+                    remote[filename] = obj['Size']
+        return remote
+
+    @staticmethod
+    def _needs_upload(local, indexed, remote_size):
+        """Decide whether a local recording must be (re-)uploaded"""
+        if remote_size is None or remote_size != local['size']:
+            return True
+        # Same size remotely but modified locally since the last sync
+        return indexed is not None and indexed != local
+
+    def _sync_upload(self, file_path, filename):
+        """Upload a single file as part of a folder sync"""
+        self.s3_client.upload_file(
+            file_path,
+            self.bucket_name,
+            self._s3_key(filename),
+            ExtraArgs={'ServerSideEncryption': 'AES256'},
+            Config=self.sync_transfer_config
+        )
+
+    @staticmethod
+    def _load_sync_index(index_path):
+        """Load the local sync index, starting fresh if missing or corrupt"""
+        try:
+            with open(index_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_sync_index(index_path, index):
+        """Atomically write the local sync index"""
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, index_path)
@@ -15,9 +15,12 @@ from ..core.s3_uploader import S3Uploader
 class ScreenRecorderGUI:
     """Main GUI application class"""
     
-    def __init__(self):
+    def __init__(self, profile_memory=False, memory_limit_mb=None):
         self.root = self._setup_window()
-        self.recorder = ScreenRecorder()
+        self.recorder = ScreenRecorder(
+            profile_memory=profile_memory,
+            memory_limit_mb=memory_limit_mb
+        )
         self.s3_uploader = S3Uploader()
         self._init_state()
         self._create_gui()
@@ -96,6 +99,10 @@ class ScreenRecorderGUI:
                         if video_path:
                             self.current_file_path = video_path
                             self.root.after(0, lambda: self.file_info.file_path_var.set(f"File: {video_path}"))
+
+                            report_path = self.recorder.last_memory_report
+                            if report_path:
+                                self.log_section.log(f"Memory report: {report_path}")
                             
                             # Upload to S3
                             self.log_section.log("Uploading to S3...")
@@ -186,8 +186,9 @@ class FileInfoSection:
 class LogSection:
     """Logging section"""
     
-    def __init__(self, parent):
+    def __init__(self, parent, max_lines=1000):
         self.parent = parent
+        self.max_lines = max_lines
         self._create_widgets()
 
     def _create_widgets(self):
@@ -213,6 +214,12 @@ class LogSection:
 
     def log(self, message):
         self.log_text.insert(END, f"{message}\n")
+
+        # Trim the oldest lines so long sessions don't grow the widget unbounded
+        line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if line_count > self.max_lines:
+            self.log_text.delete("1.0", f"{line_count - self.max_lines + 1}.0")
+
         self.log_text.see(END)
 
 # ... (other component classes) 
\ No newline at end of file
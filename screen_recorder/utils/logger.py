@@ -4,18 +4,22 @@ from datetime import datetime
 
 class Logger:
     """Application logging functionality"""
+
+    LOG_DIR = "logs"
     
     def __init__(self):
         self._setup_logger()
 
+    @classmethod
+    def log_path(cls, filename):
+        """Return a path inside the log directory, creating it if needed"""
+        if not os.path.exists(cls.LOG_DIR):
+            os.makedirs(cls.LOG_DIR)
+        return os.path.join(cls.LOG_DIR, filename)
+
     def _setup_logger(self):
         """Configure logging settings"""
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-
-        log_file = os.path.join(
-            log_dir,
+        log_file = self.log_path(
             f"screen_recorder_{datetime.now().strftime('%Y%m%d')}.log"
         )
 
@@ -0,0 +1,152 @@
+import os
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+import psutil
+
+class MemoryMonitor:
+    """Samples process memory during a recording and enforces a ceiling"""
+
+    def __init__(self, buffer_sizes, trace=False, limit_mb=None, on_limit=None,
+                 sample_interval=1.0, snapshot_interval=60.0, top_stats=10):
+        self.buffer_sizes = buffer_sizes
+        self.trace = trace
+        self.limit_bytes = int(limit_mb * 1024 * 1024) if limit_mb else None
+        self.on_limit = on_limit
+        self.sample_interval = sample_interval
+        self.snapshot_interval = snapshot_interval
+        self.top_stats = top_stats
+        self._process = psutil.Process(os.getpid())
+        self._thread = None
+
+    def start(self):
+        """Start background sampling"""
+        self.start_time = time.time()
+        self.sample_count = 0
+        self.peak_rss = 0
+        self.peak_buffers = {}
+        self.timeline = []
+        self.snapshots = []
+        self.limit_hit_at = None
+        self.limit_hit_phase = None
+        # Owners update this so a ceiling hit can be attributed to a phase
+        self.phase = "recording"
+        self._baseline = None
+        self._started_tracing = False
+
+        if self.trace:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            self._baseline = tracemalloc.take_snapshot()
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and take the final measurements"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        self._sample()
+        self._record_timeline()
+        if self.trace:
+            self._final_snapshot = tracemalloc.take_snapshot()
+            self._record_snapshot(self._final_snapshot)
+            if self._started_tracing:
+                tracemalloc.stop()
+        self.end_time = time.time()
+
+    def _run(self):
+        """Sample every interval, record timeline and snapshots less often"""
+        next_snapshot = time.monotonic() + self.snapshot_interval
+        while not self._stop_event.wait(self.sample_interval):
+            try:
+                self._sample()
+                if time.monotonic() >= next_snapshot:
+                    self._record_timeline()
+                    if self.trace:
+                        self._record_snapshot(tracemalloc.take_snapshot())
+                    next_snapshot += self.snapshot_interval
+            except Exception as e:
+                print(f"Memory monitor error: {str(e)}")
+
+    def _sample(self):
+        """Measure RSS and buffer sizes, firing on_limit once at the ceiling"""
+        rss = self._process.memory_info().rss
+        self.sample_count += 1
+        self.peak_rss = max(self.peak_rss, rss)
+        for name, size in self.buffer_sizes().items():
+            self.peak_buffers[name] = max(self.peak_buffers.get(name, 0), size)
+
+        if self.limit_bytes and rss >= self.limit_bytes and self.limit_hit_at is None:
+            self.limit_hit_at = time.time() - self.start_time
+            self.limit_hit_phase = self.phase
+            if self.on_limit:
+                self.on_limit(rss)
+
+    def _record_timeline(self):
+        """Append a coarse (elapsed, rss, buffers) point to the timeline"""
+        self.timeline.append((
+            time.time() - self.start_time,
+            self._process.memory_info().rss,
+            self.buffer_sizes()
+        ))
+
+    def _record_snapshot(self, snapshot):
+        """Keep a summary of the snapshot rather than the snapshot itself"""
+        current, peak = tracemalloc.get_traced_memory()
+        top = snapshot.statistics('lineno')[:self.top_stats]
+        self.snapshots.append((
+            time.time() - self.start_time,
+            current,
+            peak,
+            [str(stat) for stat in top]
+        ))
+
+    def write_report(self, report_path):
+        """Write a plain-text report and return its path"""
+        lines = [
+            f"Memory report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Duration: {self.end_time - self.start_time:.1f}s ({self.sample_count} samples)",
+            f"Peak RSS: {_mb(self.peak_rss)}",
+        ]
+        if self.limit_bytes:
+            status = (f"hit at {self.limit_hit_at:.1f}s during {self.limit_hit_phase}"
+                      if self.limit_hit_at is not None else "not reached")
+            lines.append(f"Ceiling: {_mb(self.limit_bytes)} ({status})")
+
+        lines.append("")
+        lines.append("Peak buffer sizes:")
+        for name, size in sorted(self.peak_buffers.items()):
+            lines.append(f"  {name}: {_mb(size)}")
+
+        lines.append("")
+        lines.append("Timeline:")
+        for elapsed, rss, buffers in self.timeline:
+            detail = ", ".join(f"{name}={_mb(size)}" for name, size in sorted(buffers.items()))
+            lines.append(f"  {elapsed:8.1f}s  rss={_mb(rss)}  {detail}")
+
+        if self.trace:
+            lines.append("")
+            lines.append("tracemalloc snapshots:")
+            for elapsed, current, peak, top in self.snapshots:
+                lines.append(f"  {elapsed:.1f}s  traced={_mb(current)}  peak={_mb(peak)}")
+                lines.extend(f"    {stat}" for stat in top)
+
+            lines.append("")
+            lines.append("Top growth since start:")
+            growth = self._final_snapshot.compare_to(self._baseline, 'lineno')
+            lines.extend(f"  {stat}" for stat in growth[:self.top_stats])
+
+        with open(report_path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        return report_path
+
+def _mb(size):
+    return f"{size / (1024 * 1024):.1f} MB"
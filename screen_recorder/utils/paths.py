@@ -0,0 +1,4 @@
+import os
+
+# Default folder for finished recordings, shared by the recorder and folder sync
+RECORDINGS_FOLDER = os.path.join(os.path.expanduser("~"), "Desktop", "ScreenRecordings")
\ No newline at end of file